@@ -107,7 +107,10 @@ class CLIContext:
             err_string = ""
             try:
                 resp = check()
-                logger.info(f"Health Check Item {step}: succeeded" + f" with response {str(resp)}" if resp else None)
+                if resp:
+                    logger.info("Health Check Item %s: succeeded with response %s", step, resp)
+                else:
+                    logger.info("Health Check Item %s: succeeded", step)
             except Exception as e:
                 status = "FAIL"
                 err_string = str(e)
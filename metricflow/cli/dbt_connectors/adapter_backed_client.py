@@ -13,7 +13,6 @@ from metricflow.errors.errors import SqlBindParametersNotSupportedError
 from metricflow.mf_logging.formatting import indent
 from metricflow.mf_logging.pretty_print import mf_pformat
 from metricflow.protocols.sql_client import SqlEngine
-from metricflow.random_id import random_id
 from metricflow.sql.render.big_query import BigQuerySqlQueryPlanRenderer
 from metricflow.sql.render.databricks import DatabricksSqlQueryPlanRenderer
 from metricflow.sql.render.duckdb_renderer import DuckDbSqlQueryPlanRenderer
@@ -136,23 +135,27 @@ class AdapterBackedSqlClient:
                 concrete values for SQL query parameters.
             extra_tags: An object containing JSON serialized tags meant for annotating queries.
         """
-        start = time.time()
-        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        request_id = SqlRequestId.create()
         if sql_bind_parameters.param_dict:
             raise SqlBindParametersNotSupportedError(
                 f"Invalid execute statement - we do not support queries with bind parameters through dbt adapters! "
                 f"Bind params: {sql_bind_parameters.param_dict}"
             )
-        logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
+            start = time.perf_counter()
         with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
             # returns a Tuple[AdapterResponse, agate.Table] but the decorator converts it to Any
             result = self._adapter.execute(sql=stmt, auto_begin=True, fetch=True)
-            logger.info(f"Query returned from dbt Adapter with response {result[0]}")
+            if info_logging_enabled:
+                logger.info(f"Query returned from dbt Adapter with response {result[0]}")
 
         agate_data = result[1]
         df = pd.DataFrame([row.values() for row in agate_data.rows], columns=agate_data.column_names)
-        stop = time.time()
-        logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the query in {stop - start:.2f}s with {len(df.index)} row(s) returned")
         return df
 
     def execute(
@@ -172,16 +175,20 @@ class AdapterBackedSqlClient:
                 f"Invalid execute statement - we do not support execute commands with bind parameters through dbt "
                 f"adapters! Bind params: {SqlBindParameters.param_dict}"
             )
-        start = time.time()
-        request_id = SqlRequestId(f"mf_rid__{random_id()}")
-        logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
+        request_id = SqlRequestId.create()
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            logger.info(AdapterBackedSqlClient._format_run_query_log_message(stmt, sql_bind_parameters))
+            start = time.perf_counter()
         with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
             result = self._adapter.execute(stmt, auto_begin=True, fetch=False)
             # Calls to execute often involve some amount of DDL so we commit here
             self._adapter.commit_if_has_connection()
-            logger.info(f"Query executed via dbt Adapter with response {result[0]}")
-        stop = time.time()
-        logger.info(f"Finished running the query in {stop - start:.2f}s")
+            if info_logging_enabled:
+                logger.info(f"Query executed via dbt Adapter with response {result[0]}")
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the query in {stop - start:.2f}s")
         return None
 
     def dry_run(
@@ -198,13 +205,19 @@ class AdapterBackedSqlClient:
             sql_bind_parameters: The parameter replacement mapping for filling in
                 concrete values for SQL query parameters.
         """
-        start = time.time()
-        logger.info(
-            f"Running dry_run of:"
-            f"\n\n{indent(stmt)}\n"
-            + (f"\nwith parameters: {dict(sql_bind_parameters.param_dict)}" if sql_bind_parameters.param_dict else "")
-        )
-        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            logger.info(
+                f"Running dry_run of:"
+                f"\n\n{indent(stmt)}\n"
+                + (
+                    f"\nwith parameters: {dict(sql_bind_parameters.param_dict)}"
+                    if sql_bind_parameters.param_dict
+                    else ""
+                )
+            )
+            start = time.perf_counter()
+        request_id = SqlRequestId.create()
         connection_name = f"MetricFlow_dry_run_request_{request_id}"
         # TODO - consolidate to self._adapter.validate_sql() when all implementations will work from within MetricFlow
 
@@ -238,8 +251,9 @@ class AdapterBackedSqlClient:
                 if has_error:
                     raise DbtDatabaseError(f"Encountered error in Databricks dry run. Full output: {plan_output_str}")
 
-        stop = time.time()
-        logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
         return
 
     def close(self) -> None:  # noqa: D
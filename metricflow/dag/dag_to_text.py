@@ -17,6 +17,37 @@ from metricflow.mf_logging.pretty_print import mf_pformat
 
 logger = logging.getLogger(__name__)
 
+_NODE_TEMPLATE = jinja2.Template(
+    textwrap.dedent(
+        """\
+        <{{ node_class }}{%- if not inner_contents and not node_fields %}/>{%- else %}>
+            {%- if node_fields %}
+            {{ node_fields | indent(4) }}
+            {%- endif %}
+            {%- if inner_contents %}
+            {{ inner_contents | indent(4) }}
+            {%- endif %}
+        </{{ node_class }}>
+        {%- endif %}
+        """
+    ),
+    undefined=jinja2.StrictUndefined,
+)
+
+_DAG_TEMPLATE = jinja2.Template(
+    textwrap.dedent(
+        """\
+        <{{ node_class }}{%- if not inner_contents %}/>{%- else %}>
+            {%- if inner_contents %}
+            {{ inner_contents | indent(4) }}
+            {%- endif %}
+        </{{ node_class }}>
+        {%- endif %}
+        """
+    ),
+    undefined=jinja2.StrictUndefined,
+)
+
 
 class MaxWidthTracker:
     """Helps to number columns remaining as the DAG is formatted to text recursively.
@@ -133,22 +164,7 @@ class MetricFlowDagTextFormatter:
                 )
                 node_fields.append(f"<!-- {self._value_indent_prefix}{value_str}{value_padding} -->")
 
-        return jinja2.Template(
-            textwrap.dedent(
-                """\
-                <{{ node_class }}{%- if not inner_contents and not node_fields %}/>{%- else %}>
-                    {%- if node_fields %}
-                    {{ node_fields | indent(4) }}
-                    {%- endif %}
-                    {%- if inner_contents %}
-                    {{ inner_contents | indent(4) }}
-                    {%- endif %}
-                </{{ node_class }}>
-                {%- endif %}
-                """
-            ),
-            undefined=jinja2.StrictUndefined,
-        ).render(
+        return _NODE_TEMPLATE.render(
             node_class=node.__class__.__name__,
             node_fields="\n".join(node_fields),
             inner_contents=inner_contents,
@@ -182,19 +198,7 @@ class MetricFlowDagTextFormatter:
                     component_from_sink_nodes_as_text.append(self.dag_component_to_text(sink_node))
 
             # Under <DataflowPlan>, render all components.
-            return jinja2.Template(
-                textwrap.dedent(
-                    """\
-                    <{{ node_class }}{%- if not inner_contents %}/>{%- else %}>
-                        {%- if inner_contents %}
-                        {{ inner_contents | indent(4) }}
-                        {%- endif %}
-                    </{{ node_class }}>
-                    {%- endif %}
-                    """
-                ),
-                undefined=jinja2.StrictUndefined,
-            ).render(
+            return _DAG_TEMPLATE.render(
                 node_class=dag.__class__.__name__,
                 inner_contents="\n".join(component_from_sink_nodes_as_text),
             )
@@ -18,6 +18,26 @@ from metricflow.visitor import VisitorOutputT
 
 logger = logging.getLogger(__name__)
 
+_GRAPHVIZ_LABEL_TEMPLATE = jinja2.Template(
+    # Formatting here: https://graphviz.org/doc/info/shapes.html#html
+    textwrap.dedent(
+        """\
+        <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
+         <TR>
+           <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
+         </TR>
+         {%- for key, value in properties %}
+         <TR>
+           <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
+           <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
+         </TR>
+         {%- endfor %}
+        </TABLE>>
+        """
+    ),
+    undefined=jinja2.StrictUndefined,
+)
+
 
 @dataclass(frozen=True)
 class DisplayedProperty:  # type: ignore
@@ -130,25 +150,7 @@ def make_graphviz_label(
         lines = [html.escape(x) for x in textwrap.wrap(str(displayed_property.value), width=40)]
         formatted_properties.append(DisplayedProperty(displayed_property.key, "<BR/>".join(lines)))
 
-    return jinja2.Template(
-        # Formatting here: https://graphviz.org/doc/info/shapes.html#html
-        textwrap.dedent(
-            """\
-            <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
-             </TR>
-             {%- for key, value in properties %}
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
-             </TR>
-             {%- endfor %}
-            </TABLE>>
-            """
-        ),
-        undefined=jinja2.StrictUndefined,
-    ).render(
+    return _GRAPHVIZ_LABEL_TEMPLATE.render(
         title=title,
         title_size=title_font_size,
         property_size=property_font_size,
@@ -42,6 +42,14 @@ from metricflow.visitor import Visitable, VisitorOutputT
 
 logger = logging.getLogger(__name__)
 
+_READ_SQL_SOURCE_NODE_TEMPLATE = jinja2.Template(
+    textwrap.dedent(
+        """\
+        <{{ class_name }} data_set={{ data_set }} />
+        """
+    )
+)
+
 NodeSelfT = TypeVar("NodeSelfT", bound="DataflowPlanNode")
 
 
@@ -211,13 +219,7 @@ class ReadSqlSourceNode(BaseOutput):
         return self._dataset
 
     def __str__(self) -> str:  # noqa: D
-        return jinja2.Template(
-            textwrap.dedent(
-                """\
-                <{{ class_name }} data_set={{ data_set }} />
-                """
-            )
-        ).render(class_name=self.__class__.__name__, data_set=str(self.data_set))
+        return _READ_SQL_SOURCE_NODE_TEMPLATE.render(class_name=self.__class__.__name__, data_set=str(self.data_set))
 
     @property
     def description(self) -> str:  # noqa: D
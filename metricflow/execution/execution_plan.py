@@ -19,6 +19,17 @@ from metricflow.visitor import Visitable
 
 logger = logging.getLogger(__name__)
 
+_CREATE_TABLE_AS_TEMPLATE = jinja2.Template(
+    textwrap.dedent(
+        """\
+        CREATE TABLE {{ output_table }} AS (
+          {{ select_query | indent(2) }}
+        )
+        """
+    ),
+    undefined=jinja2.StrictUndefined,
+)
+
 
 class ExecutionPlanTask(DagNode, Visitable, ABC):
     """A node (aka task) in the DAG representation of the execution plan.
@@ -193,16 +204,7 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
 
     @property
     def sql_query(self) -> Optional[SqlQuery]:  # noqa: D
-        query_text = jinja2.Template(
-            textwrap.dedent(
-                """\
-                CREATE TABLE {{ output_table }} AS (
-                  {{ select_query | indent(2) }}
-                )
-                """
-            ),
-            undefined=jinja2.StrictUndefined,
-        ).render(output_table=self._output_table.sql, select_query=self._sql_query)
+        query_text = _CREATE_TABLE_AS_TEMPLATE.render(output_table=self._output_table.sql, select_query=self._sql_query)
 
         return SqlQuery(
             sql_query=query_text,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Sequence, Tuple
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
@@ -18,9 +19,41 @@ from metricflow.query.issues.parsing.cumulative_metric_requires_metric_time impo
 from metricflow.query.issues.parsing.offset_metric_requires_metric_time import OffsetMetricRequiresMetricTimeIssue
 from metricflow.query.resolver_inputs.query_resolver_inputs import ResolverInputForQuery
 from metricflow.query.validation_rules.base_validation_rule import PostResolutionQueryValidationRule
+from metricflow.specs.patterns.entity_link_pattern import EntityLinkPattern, ParameterSetField
+from metricflow.specs.patterns.spec_pattern import SpecPattern
 from metricflow.specs.specs import TimeDimensionSpec
 
 
+@dataclass(frozen=True)
+class _CandidateTimeDimensionSpecs:
+    """Time dimension specs that a group-by-item could match, along with their element names for quick rejection."""
+
+    specs: Tuple[TimeDimensionSpec, ...]
+    element_names: FrozenSet[str]
+
+    @staticmethod
+    def from_specs(specs: Sequence[TimeDimensionSpec]) -> _CandidateTimeDimensionSpecs:  # noqa: D
+        return _CandidateTimeDimensionSpecs(
+            specs=tuple(specs),
+            element_names=frozenset(spec.element_name for spec in specs),
+        )
+
+    def matched_by(self, spec_pattern: SpecPattern) -> bool:
+        """Returns true if the pattern matches any of the specs.
+
+        An EntityLinkPattern that compares element names can only match specs with the same element name, so that
+        check is done first to avoid running the full match in the common case.
+        """
+        if isinstance(spec_pattern, EntityLinkPattern):
+            parameter_set = spec_pattern.parameter_set
+            if (
+                ParameterSetField.ELEMENT_NAME in parameter_set.fields_to_compare
+                and parameter_set.element_name not in self.element_names
+            ):
+                return False
+        return spec_pattern.matches_any(self.specs)
+
+
 class MetricTimeQueryValidationRule(PostResolutionQueryValidationRule):
     """Validates cases where a query requires metric_time to be specified as a group-by-item.
 
@@ -33,27 +66,33 @@ class MetricTimeQueryValidationRule(PostResolutionQueryValidationRule):
     def __init__(self, manifest_lookup: SemanticManifestLookup) -> None:  # noqa: D
         super().__init__(manifest_lookup=manifest_lookup)
 
-        self._metric_time_specs = tuple(
+        self._metric_time_specs = _CandidateTimeDimensionSpecs.from_specs(
             TimeDimensionSpec.generate_possible_specs_for_time_dimension(
                 time_dimension_reference=TimeDimensionReference(element_name=METRIC_TIME_ELEMENT_NAME), entity_links=()
             )
         )
+        # Valid agg time dimension specs only depend on the manifest, so compute them once per metric.
+        self._metric_to_valid_agg_time_dimension_specs: Dict[MetricReference, _CandidateTimeDimensionSpecs] = {}
+
+    def _get_valid_agg_time_dimension_specs(self, metric_reference: MetricReference) -> _CandidateTimeDimensionSpecs:
+        valid_agg_time_dimension_specs = self._metric_to_valid_agg_time_dimension_specs.get(metric_reference)
+        if valid_agg_time_dimension_specs is None:
+            valid_agg_time_dimension_specs = _CandidateTimeDimensionSpecs.from_specs(
+                self._manifest_lookup.metric_lookup.get_valid_agg_time_dimensions_for_metric(metric_reference)
+            )
+            self._metric_to_valid_agg_time_dimension_specs[metric_reference] = valid_agg_time_dimension_specs
+        return valid_agg_time_dimension_specs
 
-    def _group_by_items_include_metric_time(self, query_resolver_input: ResolverInputForQuery) -> bool:
-        for group_by_item_input in query_resolver_input.group_by_item_inputs:
-            if group_by_item_input.spec_pattern.matches_any(self._metric_time_specs):
-                return True
-
-        return False
-
-    def _group_by_items_include_agg_time_dimension(
+    def _group_by_items_include_metric_time_or_agg_time_dimension(
         self, query_resolver_input: ResolverInputForQuery, metric_reference: MetricReference
     ) -> bool:
-        valid_agg_time_dimension_specs = self._manifest_lookup.metric_lookup.get_valid_agg_time_dimensions_for_metric(
-            metric_reference
-        )
+        valid_agg_time_dimension_specs = self._get_valid_agg_time_dimension_specs(metric_reference)
+        # Check both sets of specs in a single pass over the group-by-items.
         for group_by_item_input in query_resolver_input.group_by_item_inputs:
-            if group_by_item_input.spec_pattern.matches_any(valid_agg_time_dimension_specs):
+            spec_pattern = group_by_item_input.spec_pattern
+            if self._metric_time_specs.matched_by(spec_pattern) or valid_agg_time_dimension_specs.matched_by(
+                spec_pattern
+            ):
                 return True
 
         return False
@@ -66,11 +105,6 @@ class MetricTimeQueryValidationRule(PostResolutionQueryValidationRule):
         resolution_path: MetricFlowQueryResolutionPath,
     ) -> MetricFlowQueryResolutionIssueSet:
         metric = self._get_metric(metric_reference)
-        query_includes_metric_time_or_agg_time_dimension = self._group_by_items_include_metric_time(
-            resolver_input_for_query
-        ) or self._group_by_items_include_agg_time_dimension(
-            query_resolver_input=resolver_input_for_query, metric_reference=metric_reference
-        )
 
         if metric.type is MetricType.SIMPLE or metric.type is MetricType.CONVERSION:
             return MetricFlowQueryResolutionIssueSet.empty_instance()
@@ -78,7 +112,9 @@ class MetricTimeQueryValidationRule(PostResolutionQueryValidationRule):
             if (
                 metric.type_params is not None
                 and (metric.type_params.window is not None or metric.type_params.grain_to_date is not None)
-                and not query_includes_metric_time_or_agg_time_dimension
+                and not self._group_by_items_include_metric_time_or_agg_time_dimension(
+                    query_resolver_input=resolver_input_for_query, metric_reference=metric_reference
+                )
             ):
                 return MetricFlowQueryResolutionIssueSet.from_issue(
                     CumulativeMetricRequiresMetricTimeIssue.from_parameters(
@@ -94,7 +130,9 @@ class MetricTimeQueryValidationRule(PostResolutionQueryValidationRule):
                 for input_metric in metric.input_metrics
             )
 
-            if has_time_offset and not query_includes_metric_time_or_agg_time_dimension:
+            if has_time_offset and not self._group_by_items_include_metric_time_or_agg_time_dimension(
+                query_resolver_input=resolver_input_for_query, metric_reference=metric_reference
+            ):
                 return MetricFlowQueryResolutionIssueSet.from_issue(
                     OffsetMetricRequiresMetricTimeIssue.from_parameters(
                         metric_reference=metric_reference,
@@ -41,6 +41,17 @@ from metricflow.sql.sql_plan import SqlSelectColumn
 
 logger = logging.getLogger(__name__)
 
+# Compiled once as parsing the template is much more expensive than rendering it.
+_MULTI_LINE_LOGICAL_ARG_TEMPLATE = jinja2.Template(
+    textwrap.dedent(
+        """\
+        (
+          {{ arg_sql | indent(2) }}
+        )
+        """
+    )
+)
+
 
 @dataclass(frozen=True)
 class SqlExpressionRenderResult:
@@ -232,19 +243,7 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
         if render_in_one_line:
             return arg_rendered.sql if not requires_parenthesis else f"({arg_rendered.sql})"
         else:
-            return (
-                jinja2.Template(
-                    textwrap.dedent(
-                        """\
-                    (
-                      {{ arg_sql | indent(2) }}
-                    )
-                    """
-                    )
-                )
-                .render(arg_sql=arg_rendered.sql)
-                .rstrip()
-            )
+            return _MULTI_LINE_LOGICAL_ARG_TEMPLATE.render(arg_sql=arg_rendered.sql).rstrip()
 
     def visit_is_null_expr(self, node: SqlIsNullExpression) -> SqlExpressionRenderResult:  # noqa: D
         arg_rendered = self.render_sql_expr(node.arg)
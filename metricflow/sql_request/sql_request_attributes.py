@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Request IDs only need to be unique (e.g. for naming connections), so a counter is used instead of generating random
+# strings. The PID is read on each call instead of at import so that forked processes, which inherit the counter, don't
+# produce the same IDs as the parent.
+_REQUEST_ID_COUNTER = itertools.count()
+
 
 @dataclass(frozen=True)
 class SqlRequestId:
@@ -14,3 +21,8 @@ class SqlRequestId:
 
     def __repr__(self) -> str:  # noqa: D
         return self.id_str
+
+    @staticmethod
+    def create() -> SqlRequestId:
+        """Create a new request ID that is distinct from those of other running processes."""
+        return SqlRequestId(f"mf_rid__{os.getpid():x}_{next(_REQUEST_ID_COUNTER)}")
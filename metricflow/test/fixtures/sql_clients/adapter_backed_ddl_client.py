@@ -32,7 +32,7 @@ class AdapterBackedDDLSqlClient(AdapterBackedSqlClient):
             chunk_size: The number of rows to insert per transaction
         """
         logger.info(f"Creating table '{sql_table.sql}' from a DataFrame with {df.shape[0]} row(s)")
-        start_time = time.time()
+        start_time = time.perf_counter()
         with self._adapter.connection_named("MetricFlow_create_from_dataframe"):
             # Create table
             # update dtypes to convert None to NA in boolean columns.
@@ -88,7 +88,7 @@ class AdapterBackedDDLSqlClient(AdapterBackedSqlClient):
             # Commit all insert transaction at once
             self._adapter.commit_if_has_connection()
 
-        logger.info(f"Created table '{sql_table.sql}' from a DataFrame in {time.time() - start_time:.2f}s")
+        logger.info(f"Created table '{sql_table.sql}' from a DataFrame in {time.perf_counter() - start_time:.2f}s")
 
     def _get_type_from_pandas_dtype(self, dtype: str) -> str:
         """Helper method to get the engine-specific type value.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -13,12 +14,17 @@ from metricflow.mf_logging.pretty_print import mf_pformat
 from metricflow.protocols.sql_client import (
     SqlClient,
 )
-from metricflow.random_id import random_id
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
-from metricflow.sql_request.sql_request_attributes import SqlRequestId
 
 logger = logging.getLogger(__name__)
 
+# Shared default for calls without parameters.
+_EMPTY_BIND_PARAMS = SqlBindParameters()
+
+# Test suites run many identical statements (e.g. schema creation, fixture queries), so the indented form used in
+# log messages is cached instead of being recomputed for every call.
+_cached_indent = functools.lru_cache(maxsize=1024)(indent)
+
 
 class SqlClientException(Exception):
     """Raised when an interaction with the SQL engine has an error."""
@@ -30,16 +36,27 @@ class BaseSqlClientImplementation(ABC, SqlClient):
     """Abstract implementation that other SQL clients are based on."""
 
     @staticmethod
-    def _format_run_query_log_message(statement: str, sql_bind_parameters: SqlBindParameters) -> str:
-        message = f"Running query:\n\n{indent(statement)}"
-        if len(sql_bind_parameters.param_dict) > 0:
-            message += f"\n\nwith parameters:\n\n{indent(mf_pformat(sql_bind_parameters.param_dict))}"
-        return message
+    def _log_running_query(statement: str, sql_bind_parameters: SqlBindParameters) -> None:
+        """Log the statement that's about to run.
+
+        Pretty-printing the parameters can be expensive, so that's only done in a separate record at the debug level.
+        """
+        if len(sql_bind_parameters.param_items) == 0:
+            logger.info("Running query:\n\n%s", _cached_indent(statement))
+            return
+
+        logger.info(
+            "Running query:\n\n%s\n\nwith parameters: %s",
+            _cached_indent(statement),
+            dict(sql_bind_parameters.param_dict),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query parameters:\n\n%s", indent(mf_pformat(sql_bind_parameters.param_dict)))
 
     def query(
         self,
         stmt: str,
-        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        sql_bind_parameters: SqlBindParameters = _EMPTY_BIND_PARAMS,
     ) -> pd.DataFrame:
         """Query statement; result expected to be data which will be returned as a DataFrame.
 
@@ -48,38 +65,42 @@ class BaseSqlClientImplementation(ABC, SqlClient):
             sql_bind_parameters: The parameter replacement mapping for filling in
                 concrete values for SQL query parameters.
         """
-        start = time.time()
-        SqlRequestId(f"mf_rid__{random_id()}")
-        logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            BaseSqlClientImplementation._log_running_query(stmt, sql_bind_parameters)
+            start = time.perf_counter()
         df = self._engine_specific_query_implementation(
             stmt=stmt,
             bind_params=sql_bind_parameters,
         )
-        if not isinstance(df, pd.DataFrame):
-            raise RuntimeError(f"Expected query to return a DataFrame, got {type(df)}")
-        stop = time.time()
-        logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
+        assert isinstance(df, pd.DataFrame), f"Expected query to return a DataFrame, got {type(df)}"
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the query in {stop - start:.2f}s with {len(df.index)} row(s) returned")
         return df
 
     def execute(  # noqa: D
         self,
         stmt: str,
-        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        sql_bind_parameters: SqlBindParameters = _EMPTY_BIND_PARAMS,
     ) -> None:
-        start = time.time()
-        logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            BaseSqlClientImplementation._log_running_query(stmt, sql_bind_parameters)
+            start = time.perf_counter()
         self._engine_specific_execute_implementation(
             stmt=stmt,
             bind_params=sql_bind_parameters,
         )
-        stop = time.time()
-        logger.info(f"Finished running the query in {stop - start:.2f}s")
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the query in {stop - start:.2f}s")
         return None
 
     def dry_run(
         self,
         stmt: str,
-        sql_bind_parameters: SqlBindParameters = SqlBindParameters(),
+        sql_bind_parameters: SqlBindParameters = _EMPTY_BIND_PARAMS,
     ) -> None:
         """Dry run statement; checks that the 'stmt' is queryable. Returns None. Raises an exception if the 'stmt' isn't queryable.
 
@@ -88,15 +109,22 @@ class BaseSqlClientImplementation(ABC, SqlClient):
             sql_bind_parameters: The parameter replacement mapping for filling in
                 concrete values for SQL query parameters.
         """
-        start = time.time()
-        logger.info(
-            f"Running dry_run of:"
-            f"\n\n{indent(stmt)}\n"
-            + (f"\nwith parameters: {dict(sql_bind_parameters.param_dict)}" if sql_bind_parameters.param_dict else "")
-        )
+        info_logging_enabled = logger.isEnabledFor(logging.INFO)
+        if info_logging_enabled:
+            logger.info(
+                f"Running dry_run of:"
+                f"\n\n{_cached_indent(stmt)}\n"
+                + (
+                    f"\nwith parameters: {dict(sql_bind_parameters.param_dict)}"
+                    if sql_bind_parameters.param_dict
+                    else ""
+                )
+            )
+            start = time.perf_counter()
         results = self._engine_specific_dry_run_implementation(stmt, sql_bind_parameters)
-        stop = time.time()
-        logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
+        if info_logging_enabled:
+            stop = time.perf_counter()
+            logger.info(f"Finished running the dry_run in {stop - start:.2f}s")
         return results
 
     @abstractmethod
@@ -15,6 +15,9 @@ from metricflow.test.fixtures.sql_clients.base_sql_client_implementation import
 
 logger = logging.getLogger(__name__)
 
+# Number of rows to insert per statement in create_table_from_dataframe() if a chunk size isn't specified.
+DEFAULT_INSERT_CHUNK_SIZE = 1000
+
 
 class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
     """Base class for to create DBClients for engines supported by SQLAlchemy."""
@@ -111,7 +114,7 @@ class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
         self, sql_table: SqlTable, df: pd.DataFrame, chunk_size: Optional[int] = None
     ) -> None:
         logger.info(f"Creating table '{sql_table.sql}' from a DataFrame with {df.shape[0]} row(s)")
-        start_time = time.time()
+        start_time = time.perf_counter()
         with self._engine_connection(self._engine) as conn:
             pd.io.sql.to_sql(
                 frame=df,
@@ -121,9 +124,11 @@ class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
                 index=False,
                 if_exists="fail",
                 method="multi",
-                chunksize=chunk_size,
+                # Without a chunk size, all rows are sent as a single statement, which can exceed the engine's limit
+                # on the number of bind parameters.
+                chunksize=chunk_size if chunk_size is not None else DEFAULT_INSERT_CHUNK_SIZE,
             )
-        logger.info(f"Created table '{sql_table.sql}' from a DataFrame in {time.time() - start_time:.2f}s")
+        logger.info(f"Created table '{sql_table.sql}' from a DataFrame in {time.perf_counter() - start_time:.2f}s")
 
     @staticmethod
     def validate_query_params(
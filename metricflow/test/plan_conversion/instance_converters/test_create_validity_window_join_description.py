@@ -6,24 +6,61 @@ import pytest
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 
 from metricflow.dataflow.dataflow_plan import ValidityWindowJoinDescription
+from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
 from metricflow.instances import InstanceSet
 from metricflow.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow.plan_conversion.instance_converters import CreateValidityWindowJoinDescription
 from metricflow.specs.specs import TimeDimensionSpec
 from metricflow.test.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
 
+# The listings semantic model in the SCD manifest has this validity window.
+_EXPECTED_LISTINGS_WINDOW = ValidityWindowJoinDescription(
+    window_start_dimension=TimeDimensionSpec(
+        element_name="window_start",
+        time_granularity=TimeGranularity.DAY,
+        entity_links=(),
+    ),
+    window_end_dimension=TimeDimensionSpec(
+        element_name="window_end",
+        time_granularity=TimeGranularity.DAY,
+        entity_links=(),
+    ),
+)
 
-def test_no_validity_dims(
-    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+
+@pytest.fixture(scope="module")
+def scd_dataset_mapping(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> Mapping[str, SemanticModelDataSet]:
+    """The data sets for the semantic models in the SCD manifest, keyed by semantic model name."""
+    return mf_engine_test_fixture_mapping[SemanticManifestSetup.SCD_MANIFEST].data_set_mapping
+
+
+@pytest.fixture(scope="module")
+def validity_window_converter(
     scd_semantic_manifest_lookup: SemanticManifestLookup,
+) -> CreateValidityWindowJoinDescription:
+    """The converter under test. It doesn't keep state between calls, so it's shared across tests."""
+    return CreateValidityWindowJoinDescription(semantic_model_lookup=scd_semantic_manifest_lookup.semantic_model_lookup)
+
+
+@pytest.fixture(scope="module")
+def scd_merged_listings_accounts_instance_set(scd_dataset_mapping: Mapping[str, SemanticModelDataSet]) -> InstanceSet:
+    """An instance set that includes the validity windows from both the listings and primary_accounts models."""
+    return InstanceSet.merge(
+        [scd_dataset_mapping["listings"].instance_set, scd_dataset_mapping["primary_accounts"].instance_set]
+    )
+
+
+def test_no_validity_dims(
+    scd_dataset_mapping: Mapping[str, SemanticModelDataSet],
+    validity_window_converter: CreateValidityWindowJoinDescription,
 ) -> None:
     """Tests converting an instance set with no matching dimensions to a ValidityWindowJoinDescription."""
     # bookings_source is a fact table, and has no validity window dimensions
-    dataset = mf_engine_test_fixture_mapping[SemanticManifestSetup.SCD_MANIFEST].data_set_mapping["bookings_source"]
+    dataset = scd_dataset_mapping["bookings_source"]
 
-    validity_window_join_description = CreateValidityWindowJoinDescription(
-        semantic_model_lookup=scd_semantic_manifest_lookup.semantic_model_lookup
-    ).transform(instance_set=dataset.instance_set)
+    validity_window_join_description = validity_window_converter.transform(instance_set=dataset.instance_set)
 
     assert validity_window_join_description is None, (
         f"We managed to create a validity window join description `{validity_window_join_description}` from a "
@@ -32,46 +69,32 @@ def test_no_validity_dims(
 
 
 def test_validity_window_conversion(
-    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
-    scd_semantic_manifest_lookup: SemanticManifestLookup,
+    scd_dataset_mapping: Mapping[str, SemanticModelDataSet],
+    validity_window_converter: CreateValidityWindowJoinDescription,
 ) -> None:
     """Tests converting an instance set with a single validity window into a ValidityWindowJoinDescription."""
     # The listings semantic model uses a 2-column SCD Type III layout
-    dataset = mf_engine_test_fixture_mapping[SemanticManifestSetup.SCD_MANIFEST].data_set_mapping["listings"]
-    expected_join_description = ValidityWindowJoinDescription(
-        window_start_dimension=TimeDimensionSpec(
-            element_name="window_start",
-            time_granularity=TimeGranularity.DAY,
-            entity_links=(),
-        ),
-        window_end_dimension=TimeDimensionSpec(
-            element_name="window_end", time_granularity=TimeGranularity.DAY, entity_links=()
-        ),
-    )
+    dataset = scd_dataset_mapping["listings"]
 
-    validity_window_join_description = CreateValidityWindowJoinDescription(
-        semantic_model_lookup=scd_semantic_manifest_lookup.semantic_model_lookup
-    ).transform(instance_set=dataset.instance_set)
+    validity_window_join_description = validity_window_converter.transform(instance_set=dataset.instance_set)
 
     assert (
         validity_window_join_description is not None
     ), "Failed to make a validity window join description from a dataset which should have one configured!"
     assert (
-        validity_window_join_description == expected_join_description
-    ), f"Expected validity window: `{expected_join_description}` but got: `{validity_window_join_description}`"
+        validity_window_join_description == _EXPECTED_LISTINGS_WINDOW
+    ), f"Expected validity window: `{_EXPECTED_LISTINGS_WINDOW}` but got: `{validity_window_join_description}`"
 
 
 def test_multiple_validity_windows(
-    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
-    scd_semantic_manifest_lookup: SemanticManifestLookup,
+    scd_merged_listings_accounts_instance_set: InstanceSet,
+    validity_window_converter: CreateValidityWindowJoinDescription,
 ) -> None:
     """Tests the behavior of this converter when it encounters an instance set with multiple validity windows."""
-    first_dataset = mf_engine_test_fixture_mapping[SemanticManifestSetup.SCD_MANIFEST].data_set_mapping["listings"]
-    second_dataset = mf_engine_test_fixture_mapping[SemanticManifestSetup.SCD_MANIFEST].data_set_mapping[
-        "primary_accounts"
-    ]
-    merged_instance_set = InstanceSet.merge([first_dataset.instance_set, second_dataset.instance_set])
     with pytest.raises(AssertionError, match="Found more than 1 set of validity window specs"):
-        CreateValidityWindowJoinDescription(
-            semantic_model_lookup=scd_semantic_manifest_lookup.semantic_model_lookup
-        ).transform(merged_instance_set)
+        validity_window_converter.transform(scd_merged_listings_accounts_instance_set)
+
+
+def test_no_time_dimension_instances(validity_window_converter: CreateValidityWindowJoinDescription) -> None:
+    """Tests the behavior of this converter when it encounters an instance set without any time dimensions."""
+    assert validity_window_converter.transform(InstanceSet()) is None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+
+from metricflow.query.validation_rules.metric_time_requirements import _CandidateTimeDimensionSpecs
+from metricflow.specs.patterns.entity_link_pattern import (
+    EntityLinkPattern,
+    EntityLinkPatternParameterSet,
+    ParameterSetField,
+)
+from metricflow.specs.patterns.metric_time_pattern import MetricTimePattern
+from metricflow.test.time.metric_time_dimension import MTD_SPEC_DAY, MTD_SPEC_MONTH
+
+
+@pytest.fixture(scope="module")
+def metric_time_specs() -> _CandidateTimeDimensionSpecs:  # noqa: D
+    return _CandidateTimeDimensionSpecs.from_specs((MTD_SPEC_DAY, MTD_SPEC_MONTH))
+
+
+def test_pattern_with_non_matching_element_name(metric_time_specs: _CandidateTimeDimensionSpecs) -> None:
+    """Tests that a pattern comparing a different element name is rejected."""
+    pattern = EntityLinkPattern(
+        EntityLinkPatternParameterSet.from_parameters(
+            element_name="booking_paid_at",
+            entity_links=(),
+            time_granularity=None,
+            date_part=None,
+            fields_to_compare=(ParameterSetField.ELEMENT_NAME, ParameterSetField.ENTITY_LINKS),
+        )
+    )
+    assert not metric_time_specs.matched_by(pattern)
+
+
+def test_pattern_with_matching_element_name(metric_time_specs: _CandidateTimeDimensionSpecs) -> None:
+    """Tests that a pattern comparing the same element name goes on to the full match."""
+    pattern = EntityLinkPattern(
+        EntityLinkPatternParameterSet.from_parameters(
+            element_name=MTD_SPEC_DAY.element_name,
+            entity_links=(),
+            time_granularity=TimeGranularity.MONTH,
+            date_part=None,
+            fields_to_compare=(
+                ParameterSetField.ELEMENT_NAME,
+                ParameterSetField.ENTITY_LINKS,
+                ParameterSetField.TIME_GRANULARITY,
+            ),
+        )
+    )
+    assert metric_time_specs.matched_by(pattern)
+
+    pattern_with_other_granularity = EntityLinkPattern(
+        EntityLinkPatternParameterSet.from_parameters(
+            element_name=MTD_SPEC_DAY.element_name,
+            entity_links=(),
+            time_granularity=TimeGranularity.YEAR,
+            date_part=None,
+            fields_to_compare=(
+                ParameterSetField.ELEMENT_NAME,
+                ParameterSetField.ENTITY_LINKS,
+                ParameterSetField.TIME_GRANULARITY,
+            ),
+        )
+    )
+    assert not metric_time_specs.matched_by(pattern_with_other_granularity)
+
+
+def test_pattern_without_element_name_comparison(metric_time_specs: _CandidateTimeDimensionSpecs) -> None:
+    """Tests that the element name is not used for rejection when the pattern doesn't compare it."""
+    pattern = EntityLinkPattern(
+        EntityLinkPatternParameterSet.from_parameters(
+            element_name="booking_paid_at",
+            entity_links=None,
+            time_granularity=TimeGranularity.DAY,
+            date_part=None,
+            fields_to_compare=(ParameterSetField.TIME_GRANULARITY,),
+        )
+    )
+    assert metric_time_specs.matched_by(pattern)
+
+
+def test_non_entity_link_pattern(metric_time_specs: _CandidateTimeDimensionSpecs) -> None:
+    """Tests that patterns other than EntityLinkPattern go through the full match."""
+    assert metric_time_specs.matched_by(MetricTimePattern())
+    assert not _CandidateTimeDimensionSpecs.from_specs(()).matched_by(MetricTimePattern())